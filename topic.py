@@ -3,90 +3,224 @@ from discord import app_commands
 from discord.ext import commands, tasks
 import asyncio
 import json
+import msgpack
 import re
-from collections import defaultdict
+import string
+from collections import defaultdict, deque
+import heapq
 import random
 import logging
 import os
-from typing import Optional, List, Dict, Any
+import shutil
+from typing import Optional, List, Dict, Set, Tuple, Any
 import aiohttp
-from io import BytesIO
 import time
-from bitarray import bitarray
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('StorkPuzzleBot')
 
+_NONWORD_RE = re.compile(r'\W+')
+# Deletes the same ASCII characters as _NONWORD_RE; '_' counts as a word character for \W.
+_ASCII_WORD_CHARS = set(string.ascii_letters + string.digits + '_')
+_ASCII_NONWORD_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if chr(c) not in _ASCII_WORD_CHARS))
+IMAGES_DIR = 'images'
+MAX_GUESSES_PER_WORD = 50
+SAVE_FILE = 'stork_puzzle_saves.msgpack'
+LEGACY_SAVE_FILE = 'stork_puzzle_saves.json'
+
+def _guess_history() -> deque:
+    return deque(maxlen=MAX_GUESSES_PER_WORD)
+
+def normalize_word(text: str) -> str:
+    text = text.lower()
+    if text.isascii():
+        return text.translate(_ASCII_NONWORD_TABLE)
+    return _NONWORD_RE.sub('', text)
+
+def _read_file_blocking(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _write_file_blocking(path: str, data: bytes):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
 class StorkPuzzle:
+    # current_image and players are properties over _current_mask and _player_index, so they have no slots of their own.
+    __slots__ = (
+        'grid_size', 'num_words', 'words', 'clues', 'images', '_current_mask', 'found_words',
+        'scores', '_player_index', 'channel_id', 'start_time', 'end_time', 'duration', 'guessed_words',
+        '_end_handle_ref', '_zero_key', '_one_key', 'required_codes', '_norm_words',
+    )
+
     def __init__(self, grid_size: int, num_words: int, channel_id: int):
         self.grid_size = grid_size
         self.num_words = num_words
         self.words = {}
         self.clues = {}
-        self.images = {}
-        self.current_image = "0" * num_words
-        self.players = set()
-        self.found_words = bitarray(num_words)
-        self.found_words.setall(0)
-        self.scores = defaultdict(int)
+        self.images: Dict[str, str] = {}
+        self._current_mask: int = 0
+        self.found_words: int = 0
+        self.scores: List[int] = []
+        self._player_index: Dict[int, int] = {}
         self.channel_id = channel_id
         self.start_time = None
         self.end_time = None
         self.duration = None
-        self.guessed_words = defaultdict(list)
+        self.guessed_words: Dict[int, deque] = defaultdict(_guess_history)
+        self._end_handle_ref: Optional[asyncio.TimerHandle] = None
+        self._zero_key = "0" * num_words
+        self._one_key = "1" * num_words
+        self.required_codes: Set[str] = set()
+        self._norm_words: Dict[int, str] = {}
 
     def add_word(self, word_num: int, word: str, clue: str):
         self.words[word_num] = word.lower()
         self.clues[word_num] = clue
+        self._norm_words[word_num] = normalize_word(word)
+
+    @property
+    def current_image(self) -> str:
+        return format(self._current_mask, f'0{self.num_words}b')
+
+    @current_image.setter
+    def current_image(self, code: str):
+        self._current_mask = int(code, 2)
+
+    def require_all_images(self):
+        self.required_codes = {format(i, f'0{self.num_words}b') for i in range(1 << self.num_words)}
+
+    def add_player(self, player_id: int):
+        if player_id not in self._player_index:
+            self._player_index[player_id] = len(self.scores)
+            self.scores.append(0)
+
+    @property
+    def players(self):
+        return self._player_index.keys()
+
+    def add_point(self, player_id: int):
+        self.scores[self._player_index[player_id]] += 1
+
+    def score_of(self, player_id: int) -> int:
+        index = self._player_index.get(player_id)
+        return 0 if index is None else self.scores[index]
+
+    def top_scores(self, count: int) -> List[Tuple[int, int]]:
+        player_ids = list(self._player_index)
+        # Players who joined but have not found a word yet are left off the leaderboard.
+        scored = ((index, score) for index, score in enumerate(self.scores) if score > 0)
+        top = heapq.nlargest(count, scored, key=lambda x: x[1])
+        return [(player_ids[index], score) for index, score in top]
+
+    def reveal_word(self, word_num: int):
+        self._current_mask |= self._word_bit(word_num)
+
+    def image_dir(self) -> str:
+        return os.path.join(IMAGES_DIR, str(self.channel_id))
+
+    def image_path(self, code: str) -> str:
+        return os.path.join(self.image_dir(), f'{code}.bin')
+
+    async def delete_images(self):
+        await asyncio.to_thread(shutil.rmtree, self.image_dir(), ignore_errors=True)
+
+    async def save_image(self, code: str, image_data: bytes):
+        path = self.image_path(code)
+        await asyncio.to_thread(_write_file_blocking, path, image_data)
+        self.images[code] = path
+        self.required_codes.discard(code)
+
+    def image_file(self, code: str, filename: str) -> Optional[discord.File]:
+        path = self.images.get(code)
+        if path is None:
+            return None
+        if not os.path.exists(path):
+            logger.warning(f"Image file for code {code} is missing: {path}")
+            return None
+        return discord.File(path, filename=filename)
+
+    def _word_bit(self, word_num: int) -> int:
+        # Word 1 is the leftmost character of an image code, i.e. the highest bit.
+        return 1 << (self.num_words - word_num)
 
     def check_word(self, word_num: int, guess: str) -> bool:
-        if word_num not in self.words:
+        target = self._norm_words.get(word_num)
+        if target is None or self.found_words & self._word_bit(word_num):
             return False
-        if self.found_words[word_num - 1]:
-            return False
-        guess = re.sub(r'\W+', '', guess.lower())
-        if guess == re.sub(r'\W+', '', self.words[word_num]):
-            self.found_words[word_num - 1] = 1
+        guess = normalize_word(guess)
+        if guess == target:
+            self.found_words |= self._word_bit(word_num)
             return True
-        self.guessed_words[word_num].append(guess)
+        history = self.guessed_words[word_num]
+        if guess not in history:
+            history.append(guess)
         return False
 
     def get_next_image_codes(self) -> List[str]:
-        current = int(self.current_image, 2)
-        return [format(current | (1 << i), f'0{self.num_words}b') for i in range(self.num_words) if not self.found_words[i]]
+        base = self._current_mask
+        n = self.num_words
+        unfound = ((1 << n) - 1) & ~base & ~self.found_words
+        codes = []
+        while unfound:
+            bit = unfound & -unfound
+            codes.append(format(base | bit, f'0{n}b'))
+            unfound ^= bit
+        return codes
 
     def to_dict(self):
         return {
             "grid_size": self.grid_size,
             "num_words": self.num_words,
-            "words": self.words,
-            "clues": self.clues,
-            "images": self.images,
+            "words": dict(self.words),
+            "clues": dict(self.clues),
+            "images": dict(self.images),
             "current_image": self.current_image,
-            "players": list(self.players),
-            "found_words": self.found_words.tolist(),
-            "scores": dict(self.scores),
+            "found_words": self.found_words,
+            "player_ids": list(self._player_index),
+            "scores": list(self.scores),
             "channel_id": self.channel_id,
             "start_time": self.start_time,
             "end_time": self.end_time,
             "duration": self.duration,
-            "guessed_words": dict(self.guessed_words)
+            "required_codes": list(self.required_codes),
+            "guessed_words": {word_num: list(guesses) for word_num, guesses in self.guessed_words.items()}
         }
 
     @classmethod
     def from_dict(cls, data):
         game = cls(data["grid_size"], data["num_words"], data["channel_id"])
-        game.words = data["words"]
-        game.clues = data["clues"]
+        game.words = {int(word_num): word for word_num, word in data["words"].items()}
+        game.clues = {int(word_num): clue for word_num, clue in data["clues"].items()}
         game.images = data["images"]
         game.current_image = data["current_image"]
-        game.players = set(data["players"])
-        game.found_words = bitarray(data["found_words"])
-        game.scores = defaultdict(int, data["scores"])
+        if isinstance(data["found_words"], list):
+            game.found_words = int("".join(str(int(b)) for b in data["found_words"]) or "0", 2)
+        else:
+            game.found_words = int(data["found_words"])
+        if "player_ids" in data:
+            game._player_index = {player_id: index for index, player_id in enumerate(data["player_ids"])}
+            game.scores = list(data["scores"])
+        else:
+            legacy_scores = {int(player_id): score for player_id, score in data["scores"].items()}
+            for player_id in list(data["players"]) + list(legacy_scores):
+                game.add_player(player_id)
+                game.scores[game._player_index[player_id]] = legacy_scores.get(player_id, 0)
         game.start_time = data["start_time"]
         game.end_time = data["end_time"]
         game.duration = data["duration"]
-        game.guessed_words = defaultdict(list, data["guessed_words"])
+        game.guessed_words = defaultdict(_guess_history, {
+            int(word_num): deque(guesses, maxlen=MAX_GUESSES_PER_WORD) for word_num, guesses in data["guessed_words"].items()
+        })
+        if "required_codes" in data:
+            game.required_codes = set(data["required_codes"])
+        else:
+            game.require_all_images()
+            game.required_codes.difference_update(game.images)
+        game._norm_words = {word_num: normalize_word(word) for word_num, word in game.words.items()}
         return game
 
 class StorkPuzzleBot(commands.Bot):
@@ -98,82 +232,167 @@ class StorkPuzzleBot(commands.Bot):
         self.games: Dict[int, StorkPuzzle] = {}
         self.setup_in_progress = set()
         self.command_permissions: Dict[str, List[int]] = {}
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._save_lock = asyncio.Lock()
+        self._background_tasks: Set[asyncio.Task] = set()
+        self.dirty_channels: Set[int] = set()
+        self._serialized_cache: Dict[int, Dict[str, Any]] = {}
+        self.http_session: Optional[aiohttp.ClientSession] = None
 
     async def setup_hook(self):
+        self.http_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
         await self.tree.sync()
         logger.info("Command tree synced")
-        self.check_game_timers.start()
+        await self.load_games()
+        await self.load_command_permissions()
+        self.flush_saves.start()
+
+    async def close(self):
+        await self._flush_save()
+        if self.http_session:
+            await self.http_session.close()
+        await super().close()
 
     async def on_ready(self):
         logger.info(f'{self.user} has connected to Discord!')
         await self.change_presence(activity=discord.Game(name="Stork Puzzle | /storkhelp"))
-        self.load_games()
-        self.load_command_permissions()
 
-    def save_games(self):
-        games_data = {str(channel_id): game.to_dict() for channel_id, game in self.games.items()}
-        with open('stork_puzzle_saves.json', 'w') as f:
-            json.dump(games_data, f)
+    def request_save(self, channel_id: int, delay: float = 2.0):
+        self.dirty_channels.add(channel_id)
+        if self._save_handle:
+            self._save_handle.cancel()
+        self._save_handle = self.loop.call_later(delay, lambda: self.create_background_task(self._flush_save()))
+
+    def create_background_task(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _flush_save(self):
+        if self._save_handle:
+            self._save_handle.cancel()
+            self._save_handle = None
+        async with self._save_lock:
+            if not self.dirty_channels:
+                return
+            flushed = set(self.dirty_channels)
+            games_data = self._build_games_dict()
+            try:
+                await asyncio.to_thread(self._save_games_blocking, games_data)
+            except OSError as e:
+                self.dirty_channels |= flushed
+                logger.error(f"Error saving games: {str(e)}", exc_info=True)
+
+    def _build_games_dict(self) -> Dict[str, Any]:
+        for channel_id in self.dirty_channels:
+            game = self.games.get(channel_id)
+            if game:
+                self._serialized_cache[channel_id] = game.to_dict()
+            else:
+                self._serialized_cache.pop(channel_id, None)
+        self.dirty_channels.clear()
+        return {str(channel_id): game_data for channel_id, game_data in self._serialized_cache.items()}
+
+    def _save_games_blocking(self, games_data: Dict[str, Any]):
+        tmp_path = SAVE_FILE + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(msgpack.packb(games_data, use_bin_type=True))
+        os.replace(tmp_path, SAVE_FILE)
         logger.info("Games saved successfully")
 
-    def load_games(self):
+    def _migrate_legacy_save_blocking(self) -> Dict[str, Any]:
+        with open(LEGACY_SAVE_FILE, 'r') as f:
+            games_data = json.load(f)
+        self._save_games_blocking(games_data)
+        logger.info(f"Migrated {LEGACY_SAVE_FILE} to {SAVE_FILE}")
+        return games_data
+
+    async def load_games(self):
         try:
-            with open('stork_puzzle_saves.json', 'r') as f:
-                games_data = json.load(f)
+            if not os.path.exists(SAVE_FILE) and os.path.exists(LEGACY_SAVE_FILE):
+                games_data = await asyncio.to_thread(self._migrate_legacy_save_blocking)
+            else:
+                raw = await asyncio.to_thread(_read_file_blocking, SAVE_FILE)
+                games_data = msgpack.unpackb(raw, raw=False, strict_map_key=False)
             for channel_id, game_data in games_data.items():
-                self.games[int(channel_id)] = StorkPuzzle.from_dict(game_data)
+                game = StorkPuzzle.from_dict(game_data)
+                self.games[int(channel_id)] = game
+                self._serialized_cache[int(channel_id)] = game.to_dict()
+                if game.end_time:
+                    self.schedule_game_end(game)
             logger.info("Games loaded successfully")
         except FileNotFoundError:
             logger.info("No saved games found")
-        except json.JSONDecodeError:
+        except (ValueError, msgpack.UnpackException):
             logger.error("Error decoding saved games file")
         except KeyError as e:
             logger.error(f"Missing key in saved games file: {e}")
 
-    def save_command_permissions(self):
-        with open('command_permissions.json', 'w') as f:
-            json.dump(self.command_permissions, f)
+    async def save_command_permissions(self):
+        data = json.dumps(self.command_permissions).encode()
+        await asyncio.to_thread(_write_file_blocking, 'command_permissions.json', data)
         logger.info("Command permissions saved successfully")
 
-    def load_command_permissions(self):
+    async def load_command_permissions(self):
         try:
-            with open('command_permissions.json', 'r') as f:
-                self.command_permissions = json.load(f)
+            raw = await asyncio.to_thread(_read_file_blocking, 'command_permissions.json')
+            self.command_permissions = json.loads(raw)
             logger.info("Command permissions loaded successfully")
         except FileNotFoundError:
             logger.info("No saved command permissions found")
         except json.JSONDecodeError:
             logger.error("Error decoding command permissions file")
 
-    @tasks.loop(minutes=1)
-    async def check_game_timers(self):
-        current_time = time.time()
-        for channel_id, game in list(self.games.items()):
-            if game.end_time and current_time >= game.end_time:
-                asyncio.create_task(self.end_game_task(channel_id))
+    @tasks.loop(seconds=30)
+    async def flush_saves(self):
+        await self._flush_save()
+
+    def schedule_game_end(self, game: StorkPuzzle):
+        if game._end_handle_ref:
+            game._end_handle_ref.cancel()
+        delay = max(0, game.end_time - time.time())
+        game._end_handle_ref = self.loop.call_later(delay, self._on_game_timer, game)
+
+    def _on_game_timer(self, game: StorkPuzzle):
+        game._end_handle_ref = None
+        # The channel may have been set up again since this timer was scheduled.
+        if self.games.get(game.channel_id) is game:
+            self.create_background_task(self.end_game_task(game.channel_id))
 
     async def end_game_task(self, channel_id: int):
-        channel = self.get_channel(channel_id)
-        if channel:
-            await channel.send("Time's up! The Stork Puzzle game has ended.")
+        try:
+            await self.wait_until_ready()
+            channel = self.get_channel(channel_id)
+            if channel:
+                await channel.send("Time's up! The Stork Puzzle game has ended.")
             await self.end_game(channel_id)
+        except Exception as e:
+            logger.error(f"Error ending game in channel {channel_id}: {str(e)}", exc_info=True)
 
     async def end_game(self, channel_id: int):
         game = self.games.pop(channel_id, None)
         if game:
-            self.save_games()
+            if game._end_handle_ref:
+                game._end_handle_ref.cancel()
+                game._end_handle_ref = None
+            self.request_save(channel_id)
             channel = self.get_channel(channel_id)
-            if channel:
-                await channel.send(embed=self.create_leaderboard_embed(game))
-                if "1" * game.num_words in game.images:
-                    await channel.send(file=discord.File(BytesIO(game.images["1" * game.num_words]), filename="final_puzzle.png"))
+            try:
+                if channel:
+                    await channel.send(embed=self.create_leaderboard_embed(game))
+                    final_file = game.image_file(game._one_key, "final_puzzle.png")
+                    if final_file:
+                        await channel.send(file=final_file)
+            finally:
+                await game.delete_images()
 
     def create_leaderboard_embed(self, game: StorkPuzzle) -> discord.Embed:
         embed = discord.Embed(title="🏆 Stork Puzzle Leaderboard 🏆", color=0x00ff00)
-        sorted_scores = sorted(game.scores.items(), key=lambda x: x[1], reverse=True)
-        for i, (player_id, score) in enumerate(sorted_scores[:10], 1):
+        for i, (player_id, score) in enumerate(game.top_scores(10), 1):
             player = self.get_user(player_id)
-            embed.add_field(name=f"{i}. {player.name}", value=f"{score} word(s)", inline=False)
+            name = player.name if player else f"Player {player_id}"
+            embed.add_field(name=f"{i}. {name}", value=f"{score} word(s)", inline=False)
         return embed
 
 bot = StorkPuzzleBot()
@@ -234,8 +453,12 @@ class SetupModal(discord.ui.Modal, title='Stork Puzzle Setup'):
                 clue = self.children[i*2 + 2].value
                 game.add_word(i + 1, word.strip(), clue.strip())
 
+            game.require_all_images()
+            previous_game = bot.games.get(interaction.channel_id)
+            if previous_game:
+                await previous_game.delete_images()
             bot.games[interaction.channel_id] = game
-            bot.save_games()
+            bot.request_save(interaction.channel_id)
 
             await interaction.response.send_message("Game setup complete! Use `/upload_images` to add images, then `/startgame` to begin.", ephemeral=True)
         except ValueError as e:
@@ -245,13 +468,25 @@ class ImageUploadModal(discord.ui.Modal, title='Upload Stork Puzzle Images'):
     def __init__(self, game: StorkPuzzle):
         super().__init__()
         self.game = game
-        self.add_item(discord.ui.TextInput(label='Empty Grid [0-0-0]', placeholder='Enter image URL or type "upload"'))
-        self.add_item(discord.ui.TextInput(label='Complete Grid [1-1-1]', placeholder='Enter image URL or type "upload"'))
+        self.add_item(discord.ui.TextInput(label=f'Empty Grid [{game._zero_key}]', placeholder='Enter image URL or type "upload"'))
+        self.add_item(discord.ui.TextInput(label=f'Complete Grid [{game._one_key}]', placeholder='Enter image URL or type "upload"'))
         for code in self.game.get_next_image_codes():
-            if code != "0" * self.game.num_words and code != "1" * self.game.num_words:
+            if code != self.game._zero_key and code != self.game._one_key:
                 self.add_item(discord.ui.TextInput(label=f'Image [{code}]', placeholder='Enter image URL or type "upload"'))
 
+    async def fetch_image(self, interaction: discord.Interaction, code: str, url: str):
+        try:
+            async with bot.http_session.get(url) as resp:
+                if resp.status == 200:
+                    image_data = await resp.read()
+                    await self.game.save_image(code, image_data)
+                    return
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Error fetching image for code {code} from {url}: {str(e)}")
+        await interaction.followup.send(f"Failed to fetch image from URL for code {code}", ephemeral=True)
+
     async def on_submit(self, interaction: discord.Interaction):
+        url_items = []
         for item in self.children:
             code = item.label.split('[')[1].split(']')[0].replace('-', '')
             if item.value.lower() == "upload":
@@ -264,19 +499,14 @@ class ImageUploadModal(discord.ui.Modal, title='Upload Stork Puzzle Images'):
                     )
                     attachment = response.attachments[0]
                     image_data = await attachment.read()
-                    self.game.images[code] = image_data
+                    await self.game.save_image(code, image_data)
                 except asyncio.TimeoutError:
                     await interaction.followup.send(f"Timeout: No image uploaded for code {code}", ephemeral=True)
             else:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(item.value) as resp:
-                        if resp.status == 200:
-                            image_data = await resp.read()
-                            self.game.images[code] = image_data
-                        else:
-                            await interaction.followup.send(f"Failed to fetch image from URL for code {code}", ephemeral=True)
-
-        bot.save_games()
+                url_items.append((code, item.value))
+
+        await asyncio.gather(*(self.fetch_image(interaction, code, url) for code, url in url_items))
+        bot.request_save(self.game.channel_id)
         await interaction.followup.send("Images uploaded successfully!", ephemeral=True)
 
 @bot.tree.command(name="setup", description="Start setting up a new Stork Puzzle game")
@@ -308,26 +538,30 @@ async def start_game(interaction: discord.Interaction, duration: int = 60):
                                                 ephemeral=True)
         return
 
-    if len(game.images) != 2**game.num_words:
-        await interaction.response.send_message("Not all images have been uploaded. Use `/upload_images` to add them.",
+    if game.required_codes:
+        missing = ', '.join(sorted(game.required_codes))[:1500]
+        await interaction.response.send_message(f"Not all images have been uploaded. Use `/upload_images` to add them.\nMissing images: {missing}",
                                                 ephemeral=True)
         return
 
     game.start_time = time.time()
     game.duration = duration * 60
     game.end_time = game.start_time + game.duration
+    bot.schedule_game_end(game)
 
-    await interaction.response.send_message(get_response("game_start"))
-    await interaction.followup.send(f"Grid: {game.grid_size}x{game.grid_size}, Words: {game.num_words}")
-    await interaction.followup.send("Clues:")
+    embed = discord.Embed(title=f"Grid: {game.grid_size}x{game.grid_size} — {game.num_words} words",
+                          description=f"The game will end in {duration} minutes!")
     for word_num, clue in game.clues.items():
-        await interaction.followup.send(f"Word {word_num}: {clue}")
-    
-    if "0" * game.num_words in game.images:
-        await interaction.followup.send(file=discord.File(BytesIO(game.images["0" * game.num_words]), filename="start_puzzle.png"))
-    await interaction.followup.send(f"The game will end in {duration} minutes!")
+        embed.add_field(name=f"Word {word_num}", value=clue, inline=False)
 
-    bot.save_games()
+    await interaction.response.send_message(get_response("game_start"))
+    start_file = game.image_file(game._zero_key, "start_puzzle.png")
+    if start_file:
+        await interaction.followup.send(embed=embed, file=start_file)
+    else:
+        await interaction.followup.send(embed=embed)
+
+    bot.request_save(interaction.channel_id)
 
 @bot.tree.command(name="join", description="Join the Stork Puzzle game")
 async def join_game(interaction: discord.Interaction):
@@ -337,11 +571,12 @@ async def join_game(interaction: discord.Interaction):
         return
 
     if interaction.user.id not in game.players:
-        game.players.add(interaction.user.id)
-        bot.save_games()
+        game.add_player(interaction.user.id)
+        bot.request_save(interaction.channel_id)
         await interaction.response.send_message(get_response("welcome"))
-        if "0" * game.num_words in game.images:
-            await interaction.followup.send(file=discord.File(BytesIO(game.images["0" * game.num_words]), filename="start_puzzle.png"))
+        start_file = game.image_file(game._zero_key, "start_puzzle.png")
+        if start_file:
+            await interaction.followup.send(file=start_file)
     else:
         await interaction.response.send_message("You're already in the game!", ephemeral=True)
 
@@ -361,16 +596,15 @@ async def guess_word(interaction: discord.Interaction, word_num: int, guess: str
         return
 
     if game.check_word(word_num, guess):
-        game.scores[interaction.user.id] += 1
-        new_image_code = list(game.current_image)
-        new_image_code[word_num - 1] = '1'
-        game.current_image = "".join(new_image_code)
-        bot.save_games()
+        game.add_point(interaction.user.id)
+        game.reveal_word(word_num)
+        bot.request_save(interaction.channel_id)
         await interaction.response.send_message(f"{get_response('correct_guess')} You've found word {word_num}!")
-        if game.current_image in game.images:
-            await interaction.followup.send(file=discord.File(BytesIO(game.images[game.current_image]), filename="puzzle.png"))
+        puzzle_file = game.image_file(game.current_image, "puzzle.png")
+        if puzzle_file:
+            await interaction.followup.send(file=puzzle_file)
         
-        if game.found_words.count() == game.num_words:
+        if game.found_words.bit_count() == game.num_words:
             await interaction.followup.send(get_response("game_end"))
             await bot.end_game(interaction.channel_id)
     else:
@@ -396,24 +630,23 @@ async def game_status(interaction: discord.Interaction):
         await interaction.response.send_message("No active game in this channel!", ephemeral=True)
         return
 
-    status = f"""
-    **Game Status**
-    Words Found: {game.found_words.count()}/{game.num_words}
-    Players: {len(game.players)}
-    Your Score: {game.scores[interaction.user.id]}
-    """
-    
+    status_lines = [
+        "**Game Status**",
+        f"Words Found: {game.found_words.bit_count()}/{game.num_words}",
+        f"Players: {len(game.players)}",
+        f"Your Score: {game.score_of(interaction.user.id)}",
+    ]
+
     if game.end_time:
         remaining_time = max(0, int((game.end_time - time.time()) / 60))
-        status += f"Time Remaining: {remaining_time} minutes\n"
-    
-    status += "Top 3 Players:\n"
-    sorted_scores = sorted(game.scores.items(), key=lambda x: x[1], reverse=True)[:3]
-    for i, (player_id, score) in enumerate(sorted_scores, 1):
-        player = await bot.fetch_user(player_id)
-        status += f"{i}. {player.name}: {score} word(s)\n"
+        status_lines.append(f"Time Remaining: {remaining_time} minutes")
+
+    status_lines.append("Top 3 Players:")
+    for i, (player_id, score) in enumerate(game.top_scores(3), 1):
+        player = bot.get_user(player_id) or await bot.fetch_user(player_id)
+        status_lines.append(f"{i}. {player.name}: {score} word(s)")
 
-    await interaction.response.send_message(status, ephemeral=True)
+    await interaction.response.send_message("\n".join(status_lines), ephemeral=True)
 
 @bot.tree.command(name="leaderboard", description="View the current game leaderboard")
 async def leaderboard(interaction: discord.Interaction):